@@ -1,5 +1,6 @@
+import math
 from bytefield.format import _format_bytearray, _format_numpy
-from bytefield import base, fields
+from bytefield import base
 import numpy as np
 
 
@@ -13,10 +14,25 @@ def _to_absolute_indices(shape: tuple, index: tuple) -> tuple:
     return index
 
 
-def _get_array_index(shape: tuple, index: tuple) -> int:
+def _get_strides(shape: tuple) -> tuple:
     assert shape, 'shape cannot be an empty list'
-    assert len(shape) == len(index), 'shape and index need to be the same length'
-    return sum([index[i] * int(np.prod(shape[i + 1:])) for i in range(len(index) - 1)]) + index[-1]
+    strides = [1] * len(shape)
+    for i in range(len(shape) - 1, 0, -1):
+        strides[i - 1] = strides[i] * shape[i]
+
+    return tuple(strides)
+
+
+def _get_array_index(strides: tuple, index: tuple) -> int:
+    assert len(strides) == len(index), 'strides and index need to be the same length'
+    if len(index) == 1:
+        return index[0]
+
+    array_index = 0
+    for i, stride in zip(index, strides):
+        array_index += i * stride
+
+    return array_index
 
 
 class ArrayFieldProxy:
@@ -29,7 +45,8 @@ class ArrayFieldProxy:
     but in limited capacity. See ArrayField for more detail.
 
     ArrayFieldProxy supports converting the data into a full numpy array
-    with the to_numpy() method, and supports tuple indexing such as
+    with the to_numpy() method, viewing numeric data without copying it
+    with the view() method, and supports tuple indexing such as
 
         byte_struct.arr[0, 2] = 100
 
@@ -64,11 +81,33 @@ class ArrayFieldProxy:
 
         return data['shape']
 
+    @property
+    def strides(self) -> tuple:
+        '''
+        Retrieves the strides of this proxy, in elements. The strides
+        are computed once for every shape the array is resized to.
+
+        Returns:
+            tuple: the number of elements to skip for each dimension of the array
+        '''
+        data = self.byte_struct._get_instance_data(self.field)
+        if not data.get('strides'):
+            data['strides'] = _get_strides(self.shape)
+
+        return data['strides']
+
     def to_numpy(self) -> np.array:
         '''
         Converts the proxy into a numpy array reading all
         the elements.
 
+        Arrays of numeric fields are returned with the numpy dtype
+        of the element field (see SimpleField.numpy_dtype), which keeps
+        the byte order of the field, e.g. >i2 for a big endian
+        two byte integer. Arrays of BooleanFields are returned as bool arrays.
+        Arrays of other fields are returned as object arrays holding
+        the values of the elements.
+
         Note that to_numpy does not cache results and the
         time to construct the full array is dependant on
         the size of it.
@@ -76,43 +115,102 @@ class ArrayFieldProxy:
         Returns:
             np.array: the full numpy array
         '''
-        arr = np.empty(self.shape, dtype=object)
-        arr_offset = self.byte_struct.calc_field_offset(self.field)
-        is_struct_field = isinstance(self.field._elem_field, fields.StructField)
-        for index in np.ndindex(self.shape):
-            self.field._elem_field.computed_offset = (
-                arr_offset + _get_array_index(self.shape, index) * self.field._elem_field.size
-            )
+        if self.field._np_dtype is not None:
+            return self._to_numpy_buffer()
 
-            if is_struct_field:
-                self.field._elem_field.reset(self.byte_struct)
+        # Elements are laid out in C order, read them into a flat
+        # array with a running offset and reshape it afterwards
+        arr = np.empty(int(math.prod(self.shape)), dtype=object)
+        offset = self.byte_struct.calc_field_offset(self.field)
+        elem_size = self.field._elem_field.size
+        for i in range(len(arr)):
+            arr[i] = self.field._get_element(self.byte_struct, offset)
+            offset += elem_size
 
-            arr[index] = self.field._elem_field._getvalue(self.byte_struct)
+        return arr.reshape(self.shape)
 
-        return arr
+    def _to_numpy_buffer(self) -> np.array:
+        '''
+        Reads the whole array at once using numpy, for arrays
+        of plain numeric or boolean fields.
 
-    def __getitem__(self, index):
-        index = self._validate_index(index)
+        Returns:
+            np.array: the full numpy array
+        '''
+        arr = self.view()
+        if self.field._np_bool:
+            return arr != 0
 
-        arr_offset = self.byte_struct.calc_field_offset(self.field)
-        self.field._elem_field.computed_offset = (
-            arr_offset + _get_array_index(self.shape, index) * self.field._elem_field.size
-        )
+        # Copy the data, so that the bytearray is not locked
+        # from resizing by the returned array
+        return arr.copy()
 
-        if isinstance(self.field._elem_field, fields.StructField):
-            self.field._elem_field.reset(self.byte_struct)
+    def view(self) -> np.ndarray:
+        '''
+        Creates a numpy array that views the data of this proxy, without copying it.
+        Only supported for arrays of numeric and boolean fields.
 
-        return self.field._elem_field._getvalue(self.byte_struct)
+        Writes to the view are reflected directly in the struct data. Note that
+        the underlying bytearray cannot be resized while the view exists, delete
+        the view before resizing any fields of the struct. Arrays of BooleanFields
+        are viewed as the integers they are stored as.
+
+        Returns:
+            np.ndarray: the view of the array data
+        '''
+        dtype = self.field._np_dtype
+        if dtype is None:
+            raise Exception('view() is only supported for arrays of numeric fields')
+
+        offset = self.byte_struct.calc_offset(self.field)
+        count = int(math.prod(self.shape))
+        if offset + count * dtype.itemsize > len(self.byte_struct.data):
+            raise IndexError('failed to get value: field is out of bounds')
+
+        return np.frombuffer(self.byte_struct.data, dtype=dtype, count=count, offset=offset).reshape(self.shape)
+
+    def column(self, field: base.ByteField) -> np.ndarray:
+        '''
+        Creates a numpy view of one field across all structs in this array.
+        Only supported for arrays of structs, see ByteStruct.column for details.
+
+            class Point(ByteStruct):
+                x = IntegerField()
+                y = IntegerField()
+
+            class Struct(ByteStruct):
+                points = ArrayField(16, Point)
+
+            s = Struct(data)
+            print(s.points.column(Point.x_field).sum())
+
+        The view has the same shape as the array and does not copy the data.
+
+        Args:
+            field (ByteField): the field of the element struct to view
+
+        Returns:
+            np.ndarray: the view of the field values
+        '''
+        elem_field = self.field._elem_field
+        if not self.field._is_struct_array:
+            raise Exception('column() is only supported for arrays of structs')
+
+        offset = self.byte_struct.calc_offset(self.field)
+        count = int(math.prod(self.shape))
+        return elem_field.struct_type.column(field, self.byte_struct.data, count, offset).reshape(self.shape)
+
+    def __getitem__(self, index):
+        index = self._validate_index(index)
+        return self.field._get_element(self.byte_struct, self._get_element_offset(index))
 
     def __setitem__(self, index, value):
         index = self._validate_index(index)
+        return self.field._set_element(self.byte_struct, self._get_element_offset(index), value)
 
+    def _get_element_offset(self, index):
         arr_offset = self.byte_struct.calc_field_offset(self.field)
-        self.field._elem_field.computed_offset = (
-            arr_offset + _get_array_index(self.shape, index) * self.field._elem_field.size
-        )
-
-        return self.field._elem_field._setvalue(self.byte_struct, value)
+        return arr_offset + _get_array_index(self.strides, index) * self.field._elem_field.size
 
     def _validate_index(self, index):
         if isinstance(index, int):
@@ -143,6 +241,7 @@ class ByteArrayFieldProxy:
 
     Just like ArrayFieldProxy, ByteArrayFieldProxy supports
     converting the data into a full bytearray with the to_bytearray() method.
+    To access the bytes without copying them, use to_memoryview().
 
     Slicing the array is not supported.
 
@@ -171,6 +270,25 @@ class ByteArrayFieldProxy:
         offset = self._validate_offset()
         return self.byte_struct.data[offset:offset + len(self)]
 
+    def to_memoryview(self, readonly: bool = False) -> memoryview:
+        '''
+        Creates a memoryview of the bytes of this field, without copying them.
+
+        Writes to the view are reflected directly in the struct data.
+        Note that the underlying bytearray cannot be resized while the view
+        exists, release the view (or use it as a context manager) before resizing
+        any fields of the struct.
+
+        Args:
+            readonly (bool): whether the view should be read only, False by default
+
+        Returns:
+            memoryview: the view of the bytes of this field
+        '''
+        offset = self._validate_offset()
+        view = memoryview(self.byte_struct.data)[offset:offset + len(self)]
+        return view.toreadonly() if readonly else view
+
     def __getitem__(self, index: int):
         offset = self._validate_offset()
         index = self._validate_index(index)
@@ -1,13 +1,15 @@
 
 from abc import ABC, abstractmethod
-import bytefield.fields
 from copy import deepcopy
 from typing import Iterable, Tuple
 import numpy as np
-import bytefield.array_proxy
 from bytefield.format import _format_bytearray, _format_numpy
 
 
+# Attribute names used by ByteStruct itself, which cannot be used as field names
+_RESERVED_FIELD_NAMES = frozenset({'data', 'master_offset', 'size', 'instance_with_parent_field_names'})
+
+
 class StructBase(type):
     '''
     The metaclass used for creating ByteStruct class types.
@@ -34,17 +36,19 @@ class StructBase(type):
 
         instance_fields = []
         instance_with_parent_field_names = []
+        instance_with_parent_fields = []
+        has_dynamic_size = False
 
-        for key, field in attrs.copy().items():
-            if not isinstance(field, ByteField):
-                continue
+        # Collect the fields up front, so that attrs can be written to
+        # while laying out the fields without copying the whole dict
+        byte_fields = [(key, value) for key, value in attrs.items() if isinstance(value, ByteField)]
 
-            if key in ['data', 'master_offset', 'size', 'instance_with_parent_field_names']:
+        for key, field in byte_fields:
+            if key in _RESERVED_FIELD_NAMES:
                 raise KeyError(f'a field cannot have a name of "{key}". '
                                'To resolve, rename the field to something else')
 
             field.property_name = f'{key}_field'
-            attrs[key] = property(field._getvalue, field._setvalue)
 
             if isinstance(field.offset, int):
                 field.computed_offset = field.offset
@@ -60,17 +64,23 @@ class StructBase(type):
 
             field.instance_fields = instance_fields[:]
 
+            # The property is created once the layout of the field is known
+            attrs[key] = field._make_property()
             attrs[field.property_name] = field
 
             if field.instance_with_parent:
                 instance_with_parent_field_names.append(key)
+                instance_with_parent_fields.append(field)
 
             if field.is_instance:
                 instance_fields.append(field)
 
+            if not field._has_static_size():
+                has_dynamic_size = True
+
             last_field = field
 
-        if last_field:
+        if last_field is not None:
             new_size = last_field.computed_offset + last_field.size
 
             if last_field.is_instance:
@@ -78,9 +88,21 @@ class StructBase(type):
 
             new_size += sum(f.size for f in instance_fields if f.size_includes_computation)
             attrs['min_size'] = new_size
+            attrs['_empty_data'] = bytes(new_size)
+
+        # Structs where every field has a static size always have the same size,
+        # which is equal to the minimum size of the struct
+        if last_field is None:
+            attrs['_static_size'] = 0
+        elif not has_dynamic_size:
+            attrs['_static_size'] = attrs['min_size']
+        else:
+            attrs['_static_size'] = None
 
+        attrs['_field_varnames'] = tuple(byte_fields)
         attrs['last_field'] = last_field
         attrs['instance_with_parent_field_names'] = instance_with_parent_field_names
+        attrs['_instance_with_parent_fields'] = tuple(instance_with_parent_fields)
         return super(StructBase, cls).__new__(cls, name, bases, attrs)
 
 
@@ -143,6 +165,29 @@ class ByteField(ABC):
 
         return self.size
 
+    def _has_static_size(self) -> bool:
+        '''
+        Checks if the size of this field is the same in every ByteStruct instance,
+        that is, if get_size always returns the size attribute. Fields that override
+        get_size are not considered static, as their size may depend on the ByteStruct.
+
+        Returns:
+            bool: whether the size of this field is static
+        '''
+        return not self.is_instance and type(self).get_size is ByteField.get_size
+
+    def _make_property(self) -> property:
+        '''
+        Creates the property used to access this field in its ByteStruct class.
+        Called by StructBase once the offset of the field has been computed.
+        Subclasses may override this method to create accessors specialized
+        for their layout.
+
+        Returns:
+            property: the property which gets and sets the value of this field
+        '''
+        return property(self._getvalue, self._setvalue)
+
     @abstractmethod
     def _getvalue(self, byte_struct):
         '''
@@ -210,7 +255,59 @@ class InstanceData:
         self.size = 0
 
 
-class ByteStruct(metaclass=StructBase):
+class ByteStructReprMixin:
+    '''
+    Provides the human readable representation of a ByteStruct.
+
+    The methods are kept apart from ByteStruct, as they are only needed
+    when printing or debugging structs and not when accessing fields.
+    '''
+    def check_overflow(self):
+        '''
+        Checks if the last field definition does not exceed the
+        size of the underlying data bytearray. Used to ensure
+        integrity when e.g. printing the struct.
+
+        The method throws an exception if self.size > len(self.data).
+        '''
+        if self.size > len(self.data):
+            raise OverflowError('overflow detected: fields after resize take more size than the struct data. '
+                                'Make sure to use resize_bytes=True in resize() to resize the underlying bytes')
+
+    def _print(self, indent_level: int) -> str:
+        '''
+        Constructs a human readable string that lists all
+        the fields of the struct and their current values.
+
+        Args:
+            indent_level (int): the indent level, used for printing
+                                nested structs
+
+        Returns:
+            str: the human readable string
+        '''
+        tab = '\t' * indent_level
+        r = ''
+        for varname, field in self.__class__._field_varnames:
+            try:
+                field_val = getattr(self, varname)
+            except Exception as e:
+                r += f'{tab}{varname}: [ reading error ({e.__class__.__name__}) ]\n'
+                continue
+
+            r += f'{tab}{varname} {_get_repr_formatter(field_val)(field_val, indent_level)}'
+
+            if field is not self.__class__.last_field:
+                r += '\n'
+
+        return r
+
+    def __repr__(self) -> str:
+        self.check_overflow()
+        return f'[{self.__class__.__name__} object at {hex(id(self))}]\n{self._print(0)}'
+
+
+class ByteStruct(ByteStructReprMixin, metaclass=StructBase):
     '''
     ByteStruct is the main class used for creating your own
     struct definitions. The definition consists of a list of fields
@@ -243,24 +340,163 @@ class ByteStruct(metaclass=StructBase):
         master_offset (int): the master offset used for the struct, typically 0
     '''
     def __init__(self, data: Iterable = None, master_offset: int = 0, **kwargs):
-        if data is not None:
-            if isinstance(data, bytearray):
-                self.data = data
-            else:
-                self.data = bytearray(data)
+        # Check the most common cases first: constructing an empty struct
+        # and wrapping an existing bytearray without any initial values
+        if data is None:
+            self.data = bytearray(self._empty_data)
+        elif isinstance(data, bytearray):
+            self.data = data
         else:
-            self.data = bytearray(self.min_size)
+            self.data = bytearray(data)
 
         self.master_offset = master_offset
         self.instance_data = {}
 
         if kwargs:
-            for key in kwargs:
-                setattr(self, key, kwargs[key])
+            for key, value in kwargs.items():
+                setattr(self, key, value)
+
+        # Equivalent to accessing the field properties by their names
+        for field in self.__class__._instance_with_parent_fields:
+            field._getvalue(self)
+
+    @classmethod
+    def iter_from_buffer(cls, data: Iterable, count: int = None, offset: int = 0):
+        '''
+        Iterates over structs stored back to back in the provided data.
+
+        All of the yielded structs share a single bytearray and differ only by their
+        master offset, so the data is not copied for every struct:
+
+            class Point(ByteStruct):
+                x = IntegerField()
+                y = IntegerField()
+
+            for point in Point.iter_from_buffer(f.read()):
+                print(point.x, point.y)
+
+        Only structs with a constant size, that is, structs without
+        any instance fields, can be read this way.
+
+        Args:
+            data (Iterable): the data containing the structs
+            count (int): the number of structs to read, by default as many as fit in the data
+            offset (int): the offset of the first struct in bytes, 0 by default
+
+        Yields:
+            ByteStruct: the structs read from the data, in order
+        '''
+        if not isinstance(data, bytearray):
+            data = bytearray(data)
+
+        struct_size = cls._static_size
+        count = cls._get_buffer_count(len(data), count, offset)
+        for i in range(count):
+            yield cls(data, offset + i * struct_size)
+
+    @classmethod
+    def column(cls, field: ByteField, data, count: int = None, offset: int = 0) -> np.ndarray:
+        '''
+        Creates a numpy view of one field across structs stored back to back in the data.
+
+        The returned array does not copy the data, instead it steps over
+        the data with the size of the struct:
+
+            class Point(ByteStruct):
+                x = IntegerField()
+                y = IntegerField()
 
-        if self.__class__.instance_with_parent_field_names:
-            for field_name in self.__class__.instance_with_parent_field_names:
-                getattr(self, field_name)
+            xs = Point.column(Point.x_field, data)
+            print(xs.sum())
+
+        If the data is a bytearray, the view is writable and writes go directly
+        to the data. Note that the bytearray cannot be resized while the view exists.
+        The field has to have a numpy equivalent (see SimpleField.numpy_dtype) and
+        its raw numeric values are returned, e.g. BooleanField values are returned as integers.
+        Only structs with a constant size can be viewed this way.
+
+        Args:
+            field (ByteField): the field of this struct to view
+            data: the data containing the structs, an object supporting the buffer protocol
+            count (int): the number of structs to view, by default as many as fit in the data
+            offset (int): the offset of the first struct in bytes, 0 by default
+
+        Returns:
+            np.ndarray: the view of the field values
+        '''
+        if not any(struct_field is field for _, struct_field in cls._field_varnames):
+            raise Exception(f'field {field.property_name} is not a field of {cls.__name__}')
+
+        dtype = getattr(field, 'numpy_dtype', None)
+        if dtype is None:
+            raise Exception(f'field {field.property_name} has no numpy equivalent')
+
+        count = cls._get_buffer_count(len(data), count, offset)
+        if count == 0:
+            # numpy rejects views which start past the end of the buffer
+            return np.empty(0, dtype=dtype)
+
+        return np.ndarray(
+            shape=(count,), dtype=dtype, buffer=data,
+            offset=offset + field.computed_offset, strides=(cls._static_size,)
+        )
+
+    @classmethod
+    def parse_many(cls, data, count: int = None, offset: int = 0) -> dict:
+        '''
+        Reads structs stored back to back in the data into one numpy array per field:
+
+            class Point(ByteStruct):
+                x = IntegerField()
+                y = FloatField()
+
+            points = Point.parse_many(data)
+            print(points['x'].sum(), points['y'].mean())
+
+        Each array is a copy of the values of one field (see column), so the arrays
+        do not depend on the data. Only fields which have a numpy equivalent are
+        included, and only structs with a constant size can be read this way.
+
+        Args:
+            data: the data containing the structs, an object supporting the buffer protocol
+            count (int): the number of structs to read, by default as many as fit in the data
+            offset (int): the offset of the first struct in bytes, 0 by default
+
+        Returns:
+            dict: the arrays of field values, keyed by field name
+        '''
+        count = cls._get_buffer_count(len(data), count, offset)
+        return {
+            name: cls.column(field, data, count, offset).copy()
+            for name, field in cls._field_varnames
+            if getattr(field, 'numpy_dtype', None) is not None
+        }
+
+    @classmethod
+    def _get_buffer_count(cls, data_size: int, count: int, offset: int) -> int:
+        '''
+        Validates reading structs stored back to back in a buffer.
+
+        Args:
+            data_size (int): the size of the buffer in bytes
+            count (int): the requested number of structs, None to fit as many as possible
+            offset (int): the offset of the first struct in bytes
+
+        Returns:
+            int: the number of structs to read
+        '''
+        struct_size = cls._static_size
+        if not struct_size:
+            raise Exception('only structs with a constant, non-zero size can be read from a buffer')
+
+        if count is None:
+            return max(data_size - offset, 0) // struct_size
+
+        if offset + count * struct_size > data_size:
+            raise IndexError(f'{count} structs of size {struct_size} at offset {offset} '
+                             f'are out of bounds for data with size {data_size}')
+
+        return count
 
     @property
     def size(self):
@@ -284,8 +520,8 @@ class ByteStruct(metaclass=StructBase):
         Returns:
             int: the offset after the last field in the struct
         '''
-        if not self.__class__.last_field:
-            return 0
+        if self.__class__._static_size is not None:
+            return self.__class__._static_size
 
         return self.calc_field_offset(self.__class__.last_field) + self.__class__.last_field.get_size(self)
 
@@ -351,18 +587,6 @@ class ByteStruct(metaclass=StructBase):
         if resize_bytes:
             self._resize_data(field, old_size)
 
-    def check_overflow(self):
-        '''
-        Checks if the last field definition does not exceed the
-        size of the underlying data bytearray. Used to ensure
-        integrity when e.g. printing the struct.
-
-        The method throws an exception if self.size > len(self.data).
-        '''
-        if self.size > len(self.data):
-            raise OverflowError('overflow detected: fields after resize take more size than the struct data. '
-                                'Make sure to use resize_bytes=True in resize() to resize the underlying bytes')
-
     def _ensure_is_instanced(self, field: ByteField) -> ByteField:
         '''
         Ensures that a field is instanced within the byte struct.
@@ -382,7 +606,7 @@ class ByteStruct(metaclass=StructBase):
             return field
 
         struct_field = getattr(self, field.property_name)
-        if struct_field != field:
+        if struct_field is not field:
             return struct_field
 
         copy = deepcopy(struct_field)
@@ -408,16 +632,12 @@ class ByteStruct(metaclass=StructBase):
 
         new_size = resizing_field.get_size(self)
 
-        # Make sure to modify in-place
+        # Make sure to modify in-place, slice deletion and assignment
+        # move the rest of the data with a single memmove
         if old_size > new_size:
-            rest = self.data[offset:offset + new_size] + self.data[offset + old_size:]
-            del self.data[offset:]
-            self.data.extend(rest)
+            del self.data[offset + new_size:offset + old_size]
         elif old_size < new_size:
-            added_bytes = new_size - old_size
-            rest = bytearray([0] * added_bytes) + self.data[offset + old_size:]
-            del self.data[offset + old_size:]
-            self.data.extend(rest)
+            self.data[offset + old_size:offset + old_size] = bytes(new_size - old_size)
 
     def calc_offset(self, byte_field: ByteField) -> int:
         '''
@@ -434,7 +654,12 @@ class ByteStruct(metaclass=StructBase):
         Returns:
             int: the calculated offset in bytes
         '''
-        return self.master_offset + self.calc_field_offset(byte_field)
+        # Same as calc_field_offset, inlined as this is called on every field access
+        offset = self.master_offset + byte_field.computed_offset
+        for instance_field in byte_field.instance_fields:
+            offset += instance_field.get_size(self)
+
+        return offset
 
     def calc_field_offset(self, byte_field: ByteField) -> int:
         '''
@@ -448,69 +673,75 @@ class ByteStruct(metaclass=StructBase):
         Returns:
             int: the calculated offset in bytes, without the master offset
         '''
-        if byte_field.instance_fields:
-            return byte_field.computed_offset + sum(
-                [instance_field.get_size(self) for instance_field in byte_field.instance_fields]
-            )
+        # The constant part of the offset is computed once by StructBase,
+        # only the sizes of preceding instance fields depend on the struct instance
+        offset = byte_field.computed_offset
+        for instance_field in byte_field.instance_fields:
+            offset += instance_field.get_size(self)
 
-        return byte_field.computed_offset
+        return offset
 
-    def _print(self, indent_level: int) -> str:
-        '''
-        Constructs a human readable string that lists all
-        the fields of the struct and their current values.
 
-        Args:
-            indent_level (int): the indent level, used for printing
-                                nested structs
+def _repr_struct(value: ByteStruct, indent_level: int) -> str:
+    return f'({value.__class__.__name__}):\n{value._print(indent_level + 1)}'
 
-        Returns:
-            str: the human readable string
-        '''
-        tab = '\t' * indent_level
-        r = ''
-        for varname, value in vars(self.__class__).items():
-            if not isinstance(value, property):
-                continue
 
-            try:
-                field = getattr(self, f'{varname}_field')
-            except AttributeError:
-                continue
+def _repr_bytes(value: bytearray, indent_level: int) -> str:
+    return f'({value.__class__.__name__}): {_format_bytearray(value)}'
 
-            try:
-                field_val = getattr(self, varname)
-            except Exception as e:
-                r += f'{tab}{varname}: [ reading error ({e.__class__.__name__}) ]\n'
-                continue
 
-            if isinstance(field_val, ByteStruct):
-                r += f'{tab}{varname} ({field_val.__class__.__name__}):\n{field_val._print(indent_level + 1)}'
-            elif isinstance(field_val, (bytearray, bytes, bytefield.array_proxy.ByteArrayFieldProxy)):
-                if isinstance(field_val, bytefield.array_proxy.ByteArrayFieldProxy):
-                    field_val = field_val.to_bytearray()
+def _repr_array(value: np.ndarray, indent_level: int) -> str:
+    arr_repr = _format_numpy(value)
+    if len(value) > 0:
+        arr_repr = arr_repr.replace('\n', '\n' + '\t' * (indent_level + 1))
 
-                bytes_repr = _format_bytearray(field_val)
-                r += f'{tab}{varname} ({field_val.__class__.__name__}): {bytes_repr}'
-            elif isinstance(field_val, (np.ndarray, list, bytefield.array_proxy.ArrayFieldProxy)):
-                arr_repr = ''
+    return f'({value.__class__.__name__}): {arr_repr}'
 
-                if isinstance(field_val, bytefield.array_proxy.ArrayFieldProxy):
-                    field_val = field_val.to_numpy()
 
-                arr_repr = _format_numpy(field_val)
-                if len(field_val) > 0:
-                    arr_repr = arr_repr.replace('\n', f'\n{tab}\t')
+def _repr_byte_array_proxy(value, indent_level: int) -> str:
+    return _repr_bytes(value.to_bytearray(), indent_level)
 
-                r += f'{tab}{varname} ({field_val.__class__.__name__}): {arr_repr}'
-            else:
-                r += f'{tab}{varname} ({field_val.__class__.__name__}): {field_val}'
 
-            if field.property_name != self.__class__.last_field.property_name:
-                r += '\n'
+def _repr_array_proxy(value, indent_level: int) -> str:
+    return _repr_array(value.to_numpy(), indent_level)
 
-        return r
 
-    def __repr__(self) -> str:
-        self.check_overflow()
-        return f'[{self.__class__.__name__} object at {hex(id(self))}]\n{self._print(0)}'
+def _repr_generic(value, indent_level: int) -> str:
+    return f'({value.__class__.__name__}): {value}'
+
+
+# Maps exact value types to the functions used to format them in ByteStruct._print.
+# Filled on first use by _get_repr_dispatch.
+_REPR_DISPATCH = {}
+
+
+def _get_repr_dispatch() -> dict:
+    if not _REPR_DISPATCH:
+        # Imported here, as bytefield.array_proxy imports this module
+        from bytefield.array_proxy import ArrayFieldProxy, ByteArrayFieldProxy
+        _REPR_DISPATCH.update({
+            bytearray: _repr_bytes,
+            bytes: _repr_bytes,
+            list: _repr_array,
+            np.ndarray: _repr_array,
+            ArrayFieldProxy: _repr_array_proxy,
+            ByteArrayFieldProxy: _repr_byte_array_proxy,
+        })
+
+    return _REPR_DISPATCH
+
+
+def _get_repr_formatter(value):
+    dispatch = _get_repr_dispatch()
+    formatter = dispatch.get(type(value))
+    if formatter:
+        return formatter
+
+    if isinstance(value, ByteStruct):
+        return _repr_struct
+
+    for value_type, formatter in dispatch.items():
+        if isinstance(value, value_type):
+            return formatter
+
+    return _repr_generic
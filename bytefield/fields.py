@@ -1,12 +1,70 @@
-from bytefield.array_proxy import ArrayFieldProxy, ByteArrayFieldProxy, _get_array_index
+from bytefield.array_proxy import ArrayFieldProxy, ByteArrayFieldProxy, _get_strides
 from bytefield.base import ByteStruct, ByteField
 from enum import Enum
 import struct
 import math
+import threading
 from typing import Iterable, Tuple
 import numpy as np
 
 
+# Maps struct format characters to numpy type kinds, the item size
+# is taken from the struct module as it depends on the byte order
+_FORMAT_KINDS = {
+    'b': 'i', 'h': 'i', 'i': 'i', 'l': 'i', 'q': 'i', 'n': 'i',
+    'B': 'u', 'H': 'u', 'I': 'u', 'L': 'u', 'Q': 'u', 'N': 'u',
+    'e': 'f', 'f': 'f', 'd': 'f'
+}
+
+# Maps struct byte order characters to numpy byte order characters
+_BYTE_ORDER_DTYPES = {'': '=', '@': '=', '=': '=', '<': '<', '>': '>', '!': '>'}
+
+
+def _format_to_dtype(struct_format: str) -> np.dtype:
+    '''
+    Converts a struct module format describing a single value
+    into the equivalent numpy dtype.
+
+    Args:
+        struct_format (str): the struct module format
+
+    Returns:
+        np.dtype: the equivalent dtype, None if there is none
+    '''
+    byte_order, code = struct_format[:-1], struct_format[-1:]
+    if byte_order not in _BYTE_ORDER_DTYPES or code not in _FORMAT_KINDS:
+        return None
+
+    return np.dtype(f'{_BYTE_ORDER_DTYPES[byte_order]}{_FORMAT_KINDS[code]}{struct.calcsize(struct_format)}')
+
+
+def _get_value_shape(value: Iterable) -> tuple:
+    '''
+    Gets the shape of a (nested) sequence, the same way numpy
+    would see it, without converting it to a numpy array.
+
+    Args:
+        value (Iterable): the sequence, numpy array or a single element
+
+    Returns:
+        tuple: the shape of the value
+    '''
+    shape = []
+    while isinstance(value, (list, tuple)):
+        shape.append(len(value))
+        if not value:
+            return tuple(shape)
+
+        value = value[0]
+
+    # Other sequences such as ranges or numpy arrays are left to numpy,
+    # strings are single elements of an array
+    if not isinstance(value, (str, bytes)):
+        shape.extend(np.shape(value))
+
+    return tuple(shape)
+
+
 class StructField(ByteField):
     '''
     A StructField provides a way to embed other byte structs inside a byte struct.
@@ -80,18 +138,25 @@ class StructField(ByteField):
 
     def _getvalue(self, byte_struct: ByteStruct):
         data = byte_struct._get_instance_data(self)
-        # We have to update both the data and master_offset of the inner struct:
-        # the inner data can come from user code and master_offset is dependant
-        # on the sizing of dynamic fields
-        if not data.get('inner'):
-            data['inner'] = self.struct_type(byte_struct.data, byte_struct.calc_offset(self))
+        inner = data.get('inner')
+        # The inner struct is usually created along with the parent struct
+        # (see instance_with_parent). We have to update both the data and
+        # master_offset of it: the inner data can come from user code and
+        # master_offset is dependant on the sizing of dynamic fields
+        if inner is None:
+            inner = data['inner'] = self.struct_type(byte_struct.data, byte_struct.calc_offset(self))
         else:
-            data['inner'].data = byte_struct.data
-            data['inner'].master_offset = byte_struct.calc_offset(self)
+            inner.data = byte_struct.data
+            inner.master_offset = byte_struct.calc_offset(self)
 
-        return data['inner']
+        return inner
 
     def _setvalue(self, byte_struct: ByteStruct, value):
+        # A value with less data than its size would shrink the parent data when copied
+        new_size = value.size
+        if value.master_offset + new_size > len(value.data):
+            raise IndexError('failed to set value: the struct data is smaller than its size')
+
         data = byte_struct._get_instance_data(self)
         old_inner = data.get('inner')
         if old_inner:
@@ -100,15 +165,15 @@ class StructField(ByteField):
             old_size = 0
 
         data['inner'] = value
-        new_size = data['inner'].size
         if new_size != old_size:
             byte_struct._resize_data(self, old_size)
 
+        # Only copy the bytes of the value, it may be a view into a larger struct
         offset = byte_struct.calc_offset(self)
-        byte_struct.data[offset:offset + new_size] = value.data[:]
+        byte_struct.data[offset:offset + new_size] = value.data[value.master_offset:value.master_offset + new_size]
 
         data['inner'].data = byte_struct.data
-        data['inner'].master_offset = byte_struct.calc_offset(self)
+        data['inner'].master_offset = offset
 
 
 class SimpleField(ByteField):
@@ -118,8 +183,13 @@ class SimpleField(ByteField):
     according to the struct module format provided by the user. Visit
     https://docs.python.org/3/library/struct.html to view this format specification.
 
+    The format is compiled into a struct.Struct object once, when the field
+    is created, so that it is not parsed again on every access.
+
     Attributes:
         format (str): the format this field uses to interpret the data
+        numpy_dtype (np.dtype): the numpy dtype equivalent to the format,
+                                None if the format has no single numpy equivalent
         size (int): the size of this field in bytes
         offset (Tuple[ByteField, int]): the offset of this field, None by default
     Args:
@@ -129,21 +199,85 @@ class SimpleField(ByteField):
     def __init__(self, struct_format: str, offset: Tuple[ByteField, int] = None, **kwargs):
         self.format = struct_format
         self.offset = offset
-        super().__init__(offset, struct.calcsize(struct_format), **kwargs)
+        self._compile()
+        self.numpy_dtype = _format_to_dtype(struct_format)
+        super().__init__(offset, self._struct.size, **kwargs)
+
+    def _compile(self):
+        self._struct = struct.Struct(self.format)
+        # Bind the methods once, as they are called on every access
+        self._unpack_from = self._struct.unpack_from
+        self._pack_into = self._struct.pack_into
+
+    def __getstate__(self):
+        # struct.Struct objects cannot be pickled, recompile them from the format instead
+        state = self.__dict__.copy()
+        del state['_struct']
+        del state['_unpack_from']
+        del state['_pack_into']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._compile()
+
+    def _make_property(self) -> property:
+        cls = type(self)
+        if self.instance_fields or cls._getvalue is not SimpleField._getvalue or \
+                cls._setvalue is not SimpleField._setvalue:
+            return super()._make_property()
+
+        # The field has a constant offset, bind it together with the compiled
+        # struct methods into accessors which skip the generic offset handling
+        offset = self.computed_offset
+        unpack_from = self._unpack_from
+        pack_into = self._pack_into
+        getvalue = self._getvalue
+        setvalue = self._setvalue
+
+        def fget(byte_struct):
+            try:
+                return unpack_from(byte_struct.data, byte_struct.master_offset + offset)[0]
+            except struct.error:
+                # Let the generic path report the error
+                return getvalue(byte_struct)
+
+        def fset(byte_struct, value):
+            try:
+                pack_into(byte_struct.data, byte_struct.master_offset + offset, value)
+            except struct.error:
+                setvalue(byte_struct, value)
+
+        return property(fget, fset)
 
     def _getvalue(self, byte_struct: ByteStruct):
-        offset = byte_struct.calc_offset(self)
-        if offset + self.size > len(byte_struct.data):
-            raise IndexError('failed to get value: field is out of bounds')
+        # Most fields have a constant offset, skip calc_offset for them
+        if self.instance_fields:
+            offset = byte_struct.calc_offset(self)
+        else:
+            offset = byte_struct.master_offset + self.computed_offset
 
-        return struct.unpack(self.format, byte_struct.data[offset:offset + self.size])[0]
+        # The struct module already checks the bounds, so only
+        # look at them again when reporting the error
+        try:
+            return self._unpack_from(byte_struct.data, offset)[0]
+        except struct.error:
+            if offset + self.size > len(byte_struct.data):
+                raise IndexError('failed to get value: field is out of bounds') from None
+            raise
 
     def _setvalue(self, byte_struct: ByteStruct, value):
-        offset = byte_struct.calc_offset(self)
-        if offset + self.size > len(byte_struct.data):
-            raise IndexError('failed to set value: field is out of bounds')
+        if self.instance_fields:
+            offset = byte_struct.calc_offset(self)
+        else:
+            offset = byte_struct.master_offset + self.computed_offset
 
-        byte_struct.data[offset:offset + self.size] = struct.pack(self.format, value)
+        try:
+            self._pack_into(byte_struct.data, offset, value)
+        except struct.error:
+            if offset + self.size > len(byte_struct.data):
+                raise IndexError('failed to set value: field is out of bounds') from None
+            raise
 
 
 class ByteArrayField(ByteField):
@@ -189,21 +323,26 @@ class ByteArrayField(ByteField):
         return ByteArrayFieldProxy(byte_struct, self)
 
     def _setvalue(self, byte_struct: ByteStruct, value):
-        data = byte_struct._get_instance_data(self)
+        # Convert other iterables once, so that the data is copied
+        # in a single operation instead of converting each element
+        if isinstance(value, memoryview):
+            value = value.cast('B')
+        elif not isinstance(value, (bytes, bytearray)):
+            value = bytes(value)
+
         new_length = len(value)
-        if new_length != data['size']:
+        if new_length != self.get_size(byte_struct):
+            assert self.is_instance, f'bytearray size {new_length} not matching, should be {self.size}'
             self._resize_with_data(byte_struct, new_length)
-        else:
-            assert new_length == self.size, f'bytearray size {new_length} not matching, should be {self.size}'
 
         offset = byte_struct.calc_offset(self)
-        if offset + data['size'] > len(byte_struct.data):
+        if offset + new_length > len(byte_struct.data):
             raise IndexError(
-                f'failed to set value: field at offset {offset} and size {self.size} '
+                f'failed to set value: field at offset {offset} and size {new_length} '
                 f'is out of bounds for struct with size {len(byte_struct.data)}'
             )
 
-        byte_struct.data[offset:offset + self.size] = value
+        byte_struct.data[offset:offset + new_length] = value
 
 
 class Endianness(Enum):
@@ -223,12 +362,18 @@ class Endianness(Enum):
         Returns:
             str: the format character
         '''
-        if self == Endianness.LITTLE:
-            return '<'
-        elif self == Endianness.BIG:
-            return '>'
+        return _ENDIANNESS_FORMATS[self]
 
-        return ''
+
+# Maps endianness to struct module byte order characters
+_ENDIANNESS_FORMATS = {Endianness.NATIVE: '', Endianness.LITTLE: '<', Endianness.BIG: '>'}
+
+
+# Maps the size and signedness of an integer to its struct module format character
+_INTEGER_FORMATS = {
+    (1, True): 'b', (1, False): 'B', (2, True): 'h', (2, False): 'H',
+    (4, True): 'i', (4, False): 'I', (8, True): 'q', (8, False): 'Q'
+}
 
 
 class IntegerField(SimpleField):
@@ -251,17 +396,12 @@ class IntegerField(SimpleField):
         offset: Tuple[ByteField, int] = None,
         **kwargs
     ):
-        prefix = endianness.to_format()
-        if size == 4:
-            super().__init__(f'{prefix}i' if signed else f'{prefix}I', offset=offset, **kwargs)
-        elif size == 2:
-            super().__init__(f'{prefix}h' if signed else f'{prefix}H', offset=offset, **kwargs)
-        elif size == 1:
-            super().__init__(f'{prefix}b' if signed else f'{prefix}B', offset=offset, **kwargs)
-        elif size == 8:
-            super().__init__(f'{prefix}q' if signed else f'{prefix}Q', offset=offset, **kwargs)
-        else:
-            raise ValueError('size has to be either 8, 4, 2 or 1')
+        try:
+            code = _INTEGER_FORMATS[size, bool(signed)]
+        except KeyError:
+            raise ValueError('size has to be either 8, 4, 2 or 1') from None
+
+        super().__init__(endianness.to_format() + code, offset=offset, **kwargs)
 
 
 class DoubleField(SimpleField):
@@ -315,7 +455,12 @@ class BooleanField(IntegerField):
         return bool(super()._getvalue(byte_struct))
 
     def _setvalue(self, byte_struct: ByteStruct, value: bool):
-        return super()._setvalue(byte_struct, int(value))
+        # bool is a subclass of int and can be packed directly, other
+        # values such as numpy booleans still need to be converted
+        if value.__class__ is not bool:
+            value = int(value)
+
+        return super()._setvalue(byte_struct, value)
 
 
 class StringField(ByteField):
@@ -362,27 +507,26 @@ class StringField(ByteField):
         if offset + size > len(byte_struct.data):
             raise IndexError('failed to get value: field is out of bounds')
 
-        return struct.unpack(f'{size}s', byte_struct.data[offset:offset + size])[0].decode(self.encoding)
+        return byte_struct.data[offset:offset + size].decode(self.encoding)
 
     def _setvalue(self, byte_struct: ByteStruct, value: str):
-        new_length = len(value)
+        # The field is sized in bytes, which for some encodings
+        # is not the same as the number of characters
+        encoded = value.encode(self.encoding)
+        new_length = len(encoded)
 
-        offset = byte_struct.calc_offset(self)
         if not self.is_instance:
             assert new_length == self.size, \
-                f'failed to set value: string is length is not equal to {self.size} characters'
+                f'failed to set value: string is length is not equal to {self.size} bytes'
 
-            byte_struct.data[offset:offset + self.size] = struct.pack(self.format, value.encode(self.encoding))
-            return
-
-        data = byte_struct._get_instance_data(self)
-        if offset + data['size'] > len(byte_struct.data):
+        offset = byte_struct.calc_offset(self)
+        if offset + self.get_size(byte_struct) > len(byte_struct.data):
             raise IndexError('failed to set value: field is out of bounds')
 
-        if new_length != data['size']:
+        if self.is_instance and new_length != self.get_size(byte_struct):
             self._resize_with_data(byte_struct, new_length)
 
-        byte_struct.data[offset:offset + data['size']] = struct.pack(f'{data["size"]}s', value.encode(self.encoding))
+        byte_struct.data[offset:offset + new_length] = encoded
 
 
 class ArrayField(ByteField):
@@ -473,6 +617,21 @@ class ArrayField(ByteField):
         if self._elem_field.is_instance and not isinstance(self._elem_field, StructField):
             raise NotImplementedError('instanced fields (with dynamic size) are currently not supported by ArrayField')
 
+        # Struct elements are constructed and copied directly, see _get_element
+        self._is_struct_array = isinstance(self._elem_field, StructField)
+
+        # Arrays of plain numeric fields can be read and written
+        # as a whole using numpy, instead of packing each element separately
+        self._np_dtype = None
+        self._np_bool = False
+        elem_type = type(self._elem_field)
+        if elem_type._getvalue is SimpleField._getvalue and elem_type._setvalue is SimpleField._setvalue:
+            self._np_dtype = self._elem_field.numpy_dtype
+        elif elem_type._getvalue is BooleanField._getvalue and elem_type._setvalue is BooleanField._setvalue:
+            # Booleans are stored as integers and converted after reading
+            self._np_dtype = self._elem_field.numpy_dtype
+            self._np_bool = True
+
         if shape:
             self.shape = (shape,) if isinstance(shape, int) else shape[:]
             self.is_instance = False
@@ -491,36 +650,132 @@ class ArrayField(ByteField):
 
         return self._elem_field.get_size(byte_struct) * int(math.prod(shape))
 
+    def _has_static_size(self) -> bool:
+        if self.is_instance:
+            return False
+
+        # Struct elements are always laid out with the minimum size of the struct
+        return self._is_struct_array or self._elem_field._has_static_size()
+
     def resize(self, shape: Tuple[tuple, int], byte_struct):
         data = byte_struct._get_instance_data(self)
         data['shape'] = (shape,) if isinstance(shape, int) else shape[:]
+        data['strides'] = _get_strides(data['shape'])
         data['size'] = self._elem_field.get_size(byte_struct) * int(math.prod(data['shape']))
 
     def _getvalue(self, byte_struct: ByteStruct) -> np.array:
         return ArrayFieldProxy(byte_struct, self)
 
     def _setvalue(self, byte_struct: ByteStruct, value: Iterable):
-        if isinstance(value, np.ndarray):
-            assert value.shape == self.shape, f'array shape {value.shape} not matching, should be {self.shape}'
+        value_shape = _get_value_shape(value)
+        if isinstance(value, np.ndarray) and not self.is_instance:
+            assert value_shape == self.shape, f'array shape {value_shape} not matching, should be {self.shape}'
 
         data = byte_struct._get_instance_data(self)
         if 'shape' not in data:
             data['shape'] = self.shape
 
-        value_shape = np.array(value).shape
         if value_shape != data['shape']:
             self._resize_with_data(byte_struct, value_shape)
 
+        if self._np_dtype is not None and self._set_numpy(byte_struct, value):
+            return
+
         arr = np.empty(data['shape'], dtype=object)
         arr[:] = value
 
-        arr_offset = byte_struct.calc_field_offset(self)
-        for index in np.ndindex(data['shape']):
-            self._elem_field.computed_offset = (
-                arr_offset + _get_array_index(data['shape'], index) * self._elem_field.size
-            )
+        # Elements are laid out in C order, walk them with a running offset
+        offset = byte_struct.calc_field_offset(self)
+        elem_size = self._elem_field.size
+        for elem in arr.flat:
+            self._set_element(byte_struct, offset, elem)
+            offset += elem_size
+
+    def _get_element(self, byte_struct: ByteStruct, offset: int):
+        '''
+        Reads a single element of the array.
+
+        Struct elements are constructed directly on the struct data instead
+        of going through StructField, which caches a single inner struct.
+
+        Args:
+            byte_struct (ByteStruct): the ByteStruct that the value is read from
+            offset (int): the offset of the element, without the master offset
+
+        Returns:
+            the value of the element
+        '''
+        if self._is_struct_array:
+            return self._elem_field.struct_type(byte_struct.data, byte_struct.master_offset + offset)
+
+        self._elem_field.computed_offset = offset
+        return self._elem_field._getvalue(byte_struct)
+
+    def _set_element(self, byte_struct: ByteStruct, offset: int, value):
+        '''
+        Writes a single element of the array.
+
+        Struct elements are copied directly into the struct data, as the
+        size of the array does not change when setting one of its elements.
+
+        Args:
+            byte_struct (ByteStruct): the ByteStruct that the value is set in
+            offset (int): the offset of the element, without the master offset
+            value: the value to set
+        '''
+        if self._is_struct_array:
+            size = self._elem_field.size
+            offset += byte_struct.master_offset
+            if offset + size > len(byte_struct.data):
+                raise IndexError('failed to set value: field is out of bounds')
 
-            self._elem_field._setvalue(byte_struct, arr[index])
+            if value.master_offset + size > len(value.data):
+                raise IndexError('failed to set value: the struct data is smaller than the element')
+
+            byte_struct.data[offset:offset + size] = value.data[value.master_offset:value.master_offset + size]
+            return
+
+        self._elem_field.computed_offset = offset
+        self._elem_field._setvalue(byte_struct, value)
+
+    def _set_numpy(self, byte_struct: ByteStruct, value: Iterable) -> bool:
+        '''
+        Writes the whole array at once using numpy.
+
+        Values which cannot be safely converted to the element type are not written,
+        so that the per element path can report the error.
+
+        Args:
+            byte_struct (ByteStruct): the ByteStruct that the value is set in
+            value (Iterable): the array to write
+
+        Returns:
+            bool: True if the array was written, False otherwise
+        '''
+        try:
+            source = np.asarray(value)
+            with np.errstate(over='ignore', invalid='ignore'):
+                arr = source.astype(self._np_dtype, order='C', casting='same_kind')
+        except (TypeError, ValueError):
+            return False
+
+        # numpy wraps integers and turns floats into inf when they are out
+        # of range for the element type, where the struct module raises
+        if arr.dtype.kind == 'f':
+            if np.any(np.isinf(arr) & np.isfinite(source)):
+                return False
+        elif not np.array_equal(arr, source):
+            return False
+
+        offset = byte_struct.calc_offset(self)
+        if offset + arr.nbytes > len(byte_struct.data):
+            raise IndexError('failed to set value: field is out of bounds')
+
+        # Copy the array memory directly into the data, without creating an intermediate bytes object
+        with memoryview(byte_struct.data) as view:
+            view[offset:offset + arr.nbytes] = arr.reshape(-1).view(np.uint8)
+
+        return True
 
 
 class VariableField(ByteField):
@@ -581,12 +836,40 @@ class VariableField(ByteField):
         data['child']._setvalue(byte_struct, value)
 
 
+# Values of these fields do not reference the struct they are read from,
+# so unpack_bytes can reuse a single struct for them
+_SCRATCH_FIELD_TYPES = (SimpleField, StringField)
+_scratch = threading.local()
+
+
+def _get_scratch_struct(data: Tuple[bytearray, bytes]) -> ByteStruct:
+    '''
+    Gets the ByteStruct reused by unpack_bytes in the current
+    thread, attached to the provided data. The data is not copied.
+
+    Args:
+        data (Tuple[bytearray, bytes]): the data to attach the struct to
+
+    Returns:
+        ByteStruct: the reused struct
+    '''
+    byte_struct = getattr(_scratch, 'byte_struct', None)
+    if byte_struct is None:
+        byte_struct = _scratch.byte_struct = ByteStruct(bytearray())
+
+    byte_struct.data = data
+    byte_struct.master_offset = 0
+    byte_struct.instance_data.clear()
+    return byte_struct
+
+
 def unpack_bytes(data: Tuple[bytearray, bytes, ByteStruct], field: ByteField):
     '''
     Interprets the bytes inside the data using the supplied field.
 
     If data is a ByteStruct instance, the value is directly
     retrieved from the bytearray of the ByteStruct.
+    The field itself is not modified.
 
     Args:
         data (Tuple[bytearray, bytes, ByteStruct]): the data to interpret
@@ -595,12 +878,22 @@ def unpack_bytes(data: Tuple[bytearray, bytes, ByteStruct], field: ByteField):
     Returns:
         the interpreted value
     '''
-    if field.offset is None:
-        field.offset = 0
-
     if isinstance(data, ByteStruct):
         return field._getvalue(data)
 
+    if isinstance(field, _SCRATCH_FIELD_TYPES):
+        # The fields read bytes and bytearrays directly,
+        # other inputs are converted just like ByteStruct does
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytearray(data)
+
+        byte_struct = _get_scratch_struct(data)
+        try:
+            return field._getvalue(byte_struct)
+        finally:
+            # Do not keep the data alive after reading the value
+            byte_struct.data = None
+
     byte_struct = ByteStruct(data)
     return field._getvalue(byte_struct)
 
@@ -610,6 +903,10 @@ def pack_value(value, field: ByteField) -> bytearray:
     Produces a ByteStruct with the data representing the
     supplied field and value.
 
+    The constant offset of the field is preserved: the resulting
+    bytes are prefixed with that many zero bytes. The field itself
+    is not modified.
+
     Args:
         value: the value to encode
         field (ByteField): the field used to encode the value
@@ -617,9 +914,102 @@ def pack_value(value, field: ByteField) -> bytearray:
     Returns:
         bytearray: the resulting bytes of the encoding
     '''
-    if field.offset is None:
-        field.offset = 0
-
     byte_struct = ByteStruct(bytearray(field.computed_offset + field.size))
     field._setvalue(byte_struct, value)
     return byte_struct.data
+
+
+def _get_many_count(field: ByteField, data_size: int, count: int) -> int:
+    '''
+    Validates the field for batched packing and unpacking, and gets the
+    number of values, defaulting to as many as fit in the data.
+
+    Args:
+        field (ByteField): the field used for each value
+        data_size (int): the size of the data in bytes
+        count (int): the requested number of values, or None
+
+    Returns:
+        int: the number of values
+    '''
+    if field.is_instance:
+        raise Exception('fields with dynamic sizes cannot be packed or unpacked in batches')
+
+    if field.size <= 0:
+        raise Exception('fields with a size of 0 cannot be packed or unpacked in batches')
+
+    if count is None:
+        count = max(data_size - field.computed_offset, 0) // field.size
+
+    return count
+
+
+def unpack_many(data: Tuple[bytearray, bytes], field: ByteField, count: int = None) -> list:
+    '''
+    Interprets values stored back to back in the data using the supplied field.
+
+    The first value starts at the constant offset of the field, every next
+    value follows the previous one directly. Arrays of plain SimpleFields
+    are unpacked in a single call to the struct module:
+
+        values = unpack_many(data, IntegerField(size=2))
+
+    Args:
+        data (Tuple[bytearray, bytes]): the data to interpret
+        field (ByteField): the field used to interpret each value, cannot have a dynamic size
+        count (int): the number of values to interpret, by default as many as fit in the data
+
+    Returns:
+        list: the interpreted values
+    '''
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytearray(data)
+
+    count = _get_many_count(field, len(data), count)
+    start = field.computed_offset
+    end = start + count * field.size
+    if end > len(data):
+        raise IndexError(f'cannot unpack {count} values of size {field.size} from {len(data)} bytes')
+
+    if type(field)._getvalue is SimpleField._getvalue:
+        with memoryview(data) as view:
+            # Like _getvalue, only the first value of the format is returned
+            return [values[0] for values in field._struct.iter_unpack(view[start:end])]
+
+    # Values such as proxies reference their struct, give each value its own
+    # struct, sharing the same bytearray and differing only by the master offset
+    if isinstance(data, bytes):
+        data = bytearray(data)
+
+    return [field._getvalue(ByteStruct(data, i * field.size)) for i in range(count)]
+
+
+def pack_many(values: Iterable, field: ByteField) -> bytearray:
+    '''
+    Encodes the values back to back using the supplied field.
+
+    Just like with pack_value, the constant offset of the field is
+    preserved as leading zero bytes, and the field itself is not modified.
+
+    Args:
+        values (Iterable): the values to encode
+        field (ByteField): the field used to encode each value, cannot have a dynamic size
+
+    Returns:
+        bytearray: the resulting bytes of the encoding
+    '''
+    values = list(values)
+    count = _get_many_count(field, 0, len(values))
+    data = bytearray(field.computed_offset + count * field.size)
+    if type(field)._setvalue is SimpleField._setvalue:
+        offset = field.computed_offset
+        for value in values:
+            field._pack_into(data, offset, value)
+            offset += field.size
+
+        return data
+
+    for i, value in enumerate(values):
+        field._setvalue(ByteStruct(data, i * field.size), value)
+
+    return data
@@ -1,5 +1,8 @@
+from copy import deepcopy
+import array
 import struct
 import numpy as np
+import pytest
 from bytefield import *
 
 
@@ -20,6 +23,14 @@ def test_pack_value():
 def test_unpack_value():
     assert unpack_bytes(struct.pack('i', 10), IntegerField()) == 10
     assert unpack_bytes(bytearray(8) + struct.pack('d', 3.2), DoubleField(offset=8)) == 3.2
+    assert unpack_bytes([1, 0, 0, 0], IntegerField(endianness=Endianness.LITTLE)) == 1
+    assert unpack_bytes(memoryview(b'abc'), StringField(3)) == 'abc'
+
+    class Struct(ByteStruct):
+        value = IntegerField(size=2)
+
+    assert unpack_bytes(struct.pack('h', 7), Struct.value_field) == 7
+    assert Struct.value_field.offset is None
     assert unpack_bytes(bytearray(8) + struct.pack('d', 3.2), DoubleField()) == 0
 
 
@@ -92,6 +103,22 @@ def test_instances():
     assert inst2.elements[3].elem == 0
 
 
+def test_pack_many():
+    field = IntegerField(size=2, offset=2)
+    data = pack_many([1, -2, 3], field)
+    assert data == struct.pack('x x 3h', 1, -2, 3)
+    assert unpack_many(data, field) == [1, -2, 3]
+    assert unpack_many(data, field, count=2) == [1, -2]
+
+    assert unpack_many(pack_many([True, False], BooleanField()), BooleanField()) == [True, False]
+    assert unpack_many(b'abcd', StringField(2)) == ['ab', 'cd']
+    assert unpack_many(struct.pack('<4h', 1, 2, 3, 4), SimpleField('<2h')) == [1, 3]
+    assert unpack_many(list(data), field) == [1, -2, 3]
+
+    with pytest.raises(IndexError):
+        unpack_many(data, field, count=4)
+
+
 def test_variable():
     class Struct(ByteStruct):
         variable = VariableField(0)
@@ -118,3 +145,236 @@ def test_variable():
     assert s.variable.arr[0] == 'aabb'
     assert s.variable.arr[1] == 'ccdd'
     assert len(s.data) == 16
+
+
+def test_overridden_size():
+    class PaddedField(IntegerField):
+        def get_size(self, byte_struct):
+            return self.size + byte_struct.padding
+
+    class Struct(ByteStruct):
+        padding = IntegerField()
+        value = PaddedField()
+
+    assert Struct(padding=0).size == 8
+    assert Struct(padding=4).size == 12
+
+
+def test_string_encoding():
+    class Struct(ByteStruct):
+        name = StringField(None)
+        value = IntegerField()
+
+    s = Struct(value=5)
+    s.name = 'żółw'
+    assert len(s.data) == 4 + len('żółw'.encode('utf-8'))
+    assert s.name == 'żółw'
+    assert s.value == 5
+
+
+def test_copy_field():
+    field = IntegerField(size=2, signed=False)
+    field_copy = deepcopy(field)
+    assert field_copy.format == field.format
+    assert unpack_bytes(struct.pack('H', 100), field_copy) == 100
+
+
+def test_numeric_array():
+    class Struct(ByteStruct):
+        arr = ArrayField((2, 2), IntegerField, size=2, endianness=Endianness.BIG)
+        floats = ArrayField(None, DoubleField)
+        flags = ArrayField(3, BooleanField, size=1)
+        halves = ArrayField(2, SimpleField, struct_format='<e')
+
+    s = Struct()
+    s.arr = [[1, 2], [3, 4]]
+    s.floats = [0.5, 1.5, 2.5]
+
+    assert s.data[:8] == struct.pack('>4h', 1, 2, 3, 4)
+    assert s.arr.to_numpy().dtype == np.dtype('>i2')
+    assert np.array_equal(s.arr.to_numpy(), [[1, 2], [3, 4]])
+    assert np.array_equal(s.floats.to_numpy(), [0.5, 1.5, 2.5])
+
+    s.flags = [True, False, True]
+    assert s.flags.to_numpy().dtype == np.bool_
+    assert np.array_equal(s.flags.to_numpy(), [True, False, True])
+
+    view = s.arr.view()
+    view[1, 0] = 5
+    del view
+    assert s.arr[1, 0] == 5
+
+    s.floats = np.arange(4, dtype=np.float32)
+    assert np.array_equal(s.floats.to_numpy(), [0, 1, 2, 3])
+
+    s.floats = range(3)
+    assert np.array_equal(s.floats.to_numpy(), [0, 1, 2])
+
+    s.flags = array.array('b', [0, 1, 1])
+    assert np.array_equal(s.flags.to_numpy(), [False, True, True])
+
+    s.halves = [0.5, -2.0]
+    assert s.halves.to_numpy().dtype == np.dtype('<f2')
+    assert s.data[-4:] == struct.pack('<2e', 0.5, -2.0)
+
+
+def test_numeric_array_overflow():
+    class Struct(ByteStruct):
+        shorts = ArrayField(2, IntegerField, size=2)
+        floats = ArrayField(2, FloatField, endianness=Endianness.LITTLE)
+
+    s = Struct()
+    with pytest.raises(struct.error):
+        s.shorts = [70000, 1]
+
+    with pytest.raises(OverflowError):
+        s.floats = [1e300, 1.0]
+
+    s.shorts = [-32768, 32767]
+    s.floats = [0.1, 2.5]
+    assert np.array_equal(s.shorts.to_numpy(), [-32768, 32767])
+    assert np.array_equal(s.floats.to_numpy(), np.array([0.1, 2.5], dtype=np.float32))
+
+
+def test_out_of_bounds():
+    class Struct(ByteStruct):
+        value = IntegerField()
+
+    s = Struct(bytearray(2))
+    with pytest.raises(IndexError):
+        s.value
+
+    with pytest.raises(IndexError):
+        s.value = 1
+
+    with pytest.raises(struct.error):
+        Struct().value = 'string'
+
+
+def test_iter_from_buffer():
+    class Point(ByteStruct):
+        x = IntegerField()
+        y = FloatField()
+
+    data = struct.pack('if' * 3, 1, 0.5, 2, 1.5, 3, 2.5)
+    points = list(Point.iter_from_buffer(data))
+    assert [(p.x, p.y) for p in points] == [(1, 0.5), (2, 1.5), (3, 2.5)]
+    assert points[0].data is points[2].data
+
+    assert [p.x for p in Point.iter_from_buffer(data, count=2, offset=8)] == [2, 3]
+    with pytest.raises(IndexError):
+        list(Point.iter_from_buffer(data, count=4))
+
+
+def test_column():
+    class Point(ByteStruct):
+        x = IntegerField()
+        y = DoubleField(offset=8)
+
+    data = bytearray(struct.pack('i4xd' * 3, 1, 0.5, 2, 1.5, 3, 2.5))
+    assert np.array_equal(Point.column(Point.x_field, data), [1, 2, 3])
+    assert np.array_equal(Point.column(Point.y_field, data, count=2, offset=16), [1.5, 2.5])
+
+    columns = Point.parse_many(bytes(data))
+    assert list(columns) == ['x', 'y']
+    assert np.array_equal(columns['y'], [0.5, 1.5, 2.5])
+    assert {name: len(column) for name, column in Point.parse_many(b'').items()} == {'x': 0, 'y': 0}
+
+    assert Point.column(Point.y_field, bytearray()).shape == (0,)
+    assert Point.column(Point.y_field, data, offset=len(data)).dtype == Point.y_field.numpy_dtype
+    assert len(Point.column(Point.x_field, data, count=0)) == 0
+
+    ys = Point.column(Point.y_field, data)
+    ys[1] = 4.0
+    del ys
+    assert list(Point.iter_from_buffer(data))[1].y == 4.0
+
+    class Struct(ByteStruct):
+        header = IntegerField(size=2)
+        points = ArrayField(3, Point)
+
+    s = Struct(bytearray(2) + data)
+    assert np.array_equal(s.points.column(Point.x_field), [1, 2, 3])
+    with pytest.raises(Exception):
+        Point.column(Struct.header_field, data)
+
+    class DynamicStruct(ByteStruct):
+        points = ArrayField(None, Point)
+
+    s = DynamicStruct()
+    assert len(s.points.column(Point.y_field)) == 0
+    with pytest.raises(Exception):
+        s.points.column(Struct.header_field)
+
+
+def test_struct_array():
+    class Point(ByteStruct):
+        x = IntegerField()
+
+    class Struct(ByteStruct):
+        header = IntegerField(size=2)
+        points = ArrayField(3, Point)
+
+    point = Point(x=7)
+    s = Struct()
+    s.points[1] = point
+    s.points[2] = s.points[1]
+    assert len(s.data) == 14
+    assert [p.x for p in s.points.to_numpy()] == [0, 7, 7]
+
+    s.points = [point, Point(x=1), point]
+    assert len(s.data) == 14
+    assert s.points[1].x == 1
+
+    with pytest.raises(IndexError):
+        s.points[0] = Point(bytearray(2))
+    assert len(s.data) == 14
+
+
+def test_set_struct_view():
+    class Point(ByteStruct):
+        x = IntegerField()
+
+    class Pair(ByteStruct):
+        first = StructField(Point)
+        second = StructField(Point)
+
+    pair = Pair()
+    pair.second.x = 5
+    s = Pair()
+    s.first = pair.second
+    assert s.data == struct.pack('2i', 5, 0)
+
+    with pytest.raises(IndexError):
+        s.second = Point(bytearray(2))
+    assert s.data == struct.pack('2i', 5, 0)
+
+
+def test_dynamic_byte_array():
+    class Struct(ByteStruct):
+        payload = ByteArrayField(None)
+        value = IntegerField()
+
+    s = Struct(value=9)
+    s.payload = [1, 2, 3]
+    s.payload = (4, 5)
+    assert s.data == bytearray([4, 5]) + struct.pack('i', 9)
+
+    s.payload = memoryview(struct.pack('2h', 1, 2))
+    assert s.payload.to_bytearray() == struct.pack('2h', 1, 2)
+    assert s.value == 9
+
+
+def test_byte_array_view():
+    class Struct(ByteStruct):
+        header = IntegerField()
+        payload = ByteArrayField(4)
+
+    s = Struct(payload=[1, 2, 3, 4])
+    with s.payload.to_memoryview() as view:
+        assert view.tobytes() == bytes([1, 2, 3, 4])
+        view[0] = 10
+
+    assert s.payload[0] == 10
+    with s.payload.to_memoryview(readonly=True) as view:
+        assert view.readonly